@@ -6,36 +6,83 @@ Claude Code Skill Validator
 验证 skill 目录结构和 SKILL.md 文件是否符合最佳实践。
 """
 
+import functools
 import os
 import re
 import sys
-import yaml
-
-# 设置控制台编码为 UTF-8（Windows 兼容）
-if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# 预编译的正则表达式
+_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+# references 链接为字节模式，直接在 SKILL.md 的内存映射上匹配
+_REF_RE = re.compile(rb'\[[^\]]+\]\(references/([^\)]+)\)')
+# Windows 路径需要 Unicode 的 \w，只在命中的行解码后匹配
+_WIN_PATH_RE = re.compile(r'[\w-]+\\\\[\w-]+')
+
+# frontmatter 检查时首次读取的字节数，frontmatter 通常位于此范围内
+_HEAD_SIZE = 8192
+
+# validate_cached 参与缓存键的顶层条目，另外 references/ 下每一级目录的 mtime 也计入缓存键
+_CACHE_KEY_ENTRIES = ('', 'SKILL.md', 'skill.md', 'references', 'scripts')
+
+# 批量验证时，skill 数量达到该值才使用进程池，否则使用线程池
+_PROCESS_POOL_THRESHOLD = 8
+
+
+def _normalize_newlines(data: bytes) -> bytes:
+    """与文本模式读取一致，统一换行符为 \\n"""
+    return data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+
+def _format_message(item: Tuple[str, tuple]) -> str:
+    """格式化一条 (fmt, args) 形式的结果"""
+    fmt, args = item
+    return fmt % args if args else fmt
 
 
 class SkillValidator:
     """Skill 验证器"""
 
     def __init__(self, skill_path: str):
+        # Path 仅用于报告显示，文件操作使用预先拼接好的字符串路径
         self.skill_path = Path(skill_path)
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.passed_checks: List[str] = []
+        self._skill_dir = os.fspath(skill_path)
+        self._skill_md_upper = os.path.join(self._skill_dir, "SKILL.md")
+        self._skill_md_lower = os.path.join(self._skill_dir, "skill.md")
+        self._refs_dir = os.path.join(self._skill_dir, "references")
+        self._scripts_dir = os.path.join(self._skill_dir, "scripts")
+        # 各项结果以 (fmt, args) 形式记录，输出时才格式化
+        self._errors: List[Tuple[str, tuple]] = []
+        self._warnings: List[Tuple[str, tuple]] = []
+        self._passed: List[Tuple[str, tuple]] = []
+        self.frontmatter: Optional[Dict] = None
+        # 扫描 skill 目录失败时的异常，用于报告具体原因
+        self._dir_error: Optional[OSError] = None
+        self._paths: Dict[str, os.DirEntry] = {}
+        self._skill_md_exists = False
+        self._skill_md_head = b''
+        self._skill_md_truncated = False
+        # SKILL.md 的原始字节，正文检查直接在其上查找，不整体解码
+        self._skill_md_data = b''
+        # SKILL.md 缺失或 frontmatter 无法解析时置为 True，跳过扫描正文的检查
+        self._fatal = False
+        # 已检查的引用目标路径，validate_cached 据此判断结果能否缓存
+        self._ref_targets: List[str] = []
 
     def validate(self) -> bool:
-        """执行所有验证检查"""
-        print(f"验证 skill: {self.skill_path}")
-        print("=" * 50)
+        """执行所有验证检查并打印结果"""
+        success = self.run_checks()
+        self._print_results()
+        return success
 
+    def run_checks(self) -> bool:
+        """执行所有验证检查（不打印），返回是否通过"""
+        self._scan_skill_dir()
         self._check_directory_exists()
         self._check_skill_md_exists()
+        self._load_skill_md()
         self._check_yaml_frontmatter()
         self._check_name_format()
         self._check_description_length()
@@ -43,208 +90,394 @@ class SkillValidator:
         self._check_scripts()
         self._check_path_formats()
 
-        self._print_results()
-        return len(self.errors) == 0
+        return len(self._errors) == 0
+
+    @classmethod
+    def validate_cached(cls, skill_path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+        """带进程内 LRU 缓存的验证，返回 (errors, warnings, passed_checks)
+
+        缓存键只由 os.stat 得到的 mtime 和 size 组成，不读取文件内容；
+        文件被修改、references/ 下任意目录中有文件增删时 mtime 变化，缓存自动失效。
+        引用目标解析到 references/ 之外（如 ../ 或符号链接）时结果不缓存。
+        """
+        skill_dir = os.path.abspath(skill_path)
+        try:
+            return _validate_cached(cls, skill_dir, _cache_key(skill_dir))
+        except _Uncacheable as e:
+            return e.result
+
+    @property
+    def errors(self) -> Tuple[str, ...]:
+        """错误项（只读，记录结果请使用 _add_* 方法）"""
+        return tuple(_format_message(item) for item in self._errors)
+
+    @property
+    def warnings(self) -> Tuple[str, ...]:
+        """警告项（只读，记录结果请使用 _add_* 方法）"""
+        return tuple(_format_message(item) for item in self._warnings)
+
+    @property
+    def passed_checks(self) -> Tuple[str, ...]:
+        """已通过的检查项（只读，记录结果请使用 _add_* 方法）"""
+        return tuple(_format_message(item) for item in self._passed)
+
+    def _add_error(self, fmt: str, *args):
+        """记录一项错误"""
+        self._errors.append((fmt, args))
+
+    def _add_warning(self, fmt: str, *args):
+        """记录一项警告"""
+        self._warnings.append((fmt, args))
+
+    def _add_passed(self, fmt: str, *args):
+        """记录一项通过的检查"""
+        self._passed.append((fmt, args))
+
+    def _scan_skill_dir(self):
+        """一次性扫描 skill 目录，记录顶层条目供后续检查查询"""
+        try:
+            with os.scandir(self._skill_dir) as it:
+                for entry in it:
+                    if entry.name in ('SKILL.md', 'skill.md', 'references', 'scripts'):
+                        self._paths[entry.name] = entry
+        except OSError as e:
+            self._dir_error = e
+
+    def _has_file(self, name: str) -> bool:
+        """扫描结果中是否存在名为 name 的文件"""
+        entry = self._paths.get(name)
+        return entry is not None and entry.is_file()
+
+    def _has_dir(self, name: str) -> bool:
+        """扫描结果中是否存在名为 name 的目录"""
+        entry = self._paths.get(name)
+        return entry is not None and entry.is_dir()
 
     def _check_directory_exists(self):
         """检查目录是否存在"""
-        if not self.skill_path.exists():
-            self.errors.append(f"目录不存在: {self.skill_path}")
+        if isinstance(self._dir_error, FileNotFoundError):
+            self._add_error("目录不存在: %s", self.skill_path)
+        elif isinstance(self._dir_error, NotADirectoryError):
+            self._add_error("路径不是目录: %s", self.skill_path)
+        elif self._dir_error is not None:
+            self._add_error("无法读取目录: %s (%s)", self.skill_path, self._dir_error.strerror)
         else:
-            self.passed_checks.append("✓ 目录存在")
+            self._add_passed("✓ 目录存在")
 
     def _check_skill_md_exists(self):
         """检查 SKILL.md 文件是否存在"""
-        skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
+        if not self._has_file("SKILL.md"):
             # 也检查 skill.md (小写)
-            skill_md_lower = self.skill_path / "skill.md"
-            if not skill_md_lower.exists():
-                self.errors.append("SKILL.md 文件不存在")
+            if not self._has_file("skill.md"):
+                self._add_error("SKILL.md 文件不存在")
+                self._fatal = True
                 return
-            self.warnings.append("文件名为 skill.md，建议使用 SKILL.md (大写)")
+            self._add_warning("文件名为 skill.md，建议使用 SKILL.md (大写)")
+        else:
+            self._add_passed("✓ SKILL.md 存在")
+
+    def _load_skill_md(self):
+        """定位 SKILL.md (或 skill.md) 并一次性读取其字节内容，供后续检查复用"""
+        if self._has_file("SKILL.md"):
+            skill_md = self._skill_md_upper
+        elif self._has_file("skill.md"):
+            skill_md = self._skill_md_lower
         else:
-            self.passed_checks.append("✓ SKILL.md 存在")
+            return
+
+        self._skill_md_exists = True
+        # 不使用 mmap：扫描期间文件被其他进程截断（编辑器保存时常见）会触发 SIGBUS
+        with open(skill_md, 'rb') as f:
+            self._skill_md_data = f.read()
+        self._skill_md_truncated = len(self._skill_md_data) > _HEAD_SIZE
+        self._skill_md_head = _normalize_newlines(self._skill_md_data[:_HEAD_SIZE])
 
     def _check_yaml_frontmatter(self):
         """检查 YAML frontmatter 是否有效"""
-        skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
-            skill_md = self.skill_path / "skill.md"
-        if not skill_md.exists():
+        if not self._skill_md_exists:
             return
 
-        content = skill_md.read_text(encoding='utf-8')
+        head = self._skill_md_head
 
         # 检查是否以 --- 开头
-        if not content.startswith('---'):
-            self.errors.append("缺少 YAML frontmatter (必须以 --- 开头)")
+        if not head.startswith(b'---'):
+            self._add_error("缺少 YAML frontmatter (必须以 --- 开头)")
+            self._fatal = True
             return
 
+        # 延迟导入 yaml，目录或 SKILL.md 缺失时无需加载
+        import yaml
+        # 优先使用 libyaml 的 C 实现，未安装时回退到纯 Python 解析器
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
         # 提取 frontmatter
         try:
-            frontmatter_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-            if not frontmatter_match:
-                self.errors.append("YAML frontmatter 格式无效 (必须以 ---\\n--- 包裹)")
+            # 分隔符是固定字面量，直接用 find 定位结束位置
+            frontmatter_text = None
+            if head.startswith(b'---\n'):
+                end = head.find(b'\n---', 4)
+                if end < 0 and self._skill_md_truncated:
+                    # 首块中没有结束分隔符，回退到完整内容中查找
+                    head = _normalize_newlines(self._skill_md_data[:])
+                    end = head.find(b'\n---', 4)
+                if end >= 0:
+                    frontmatter_text = head[4:end].decode('utf-8')
+            if frontmatter_text is None:
+                self._add_error("YAML frontmatter 格式无效 (必须以 ---\\n--- 包裹)")
+                self._fatal = True
                 return
 
-            frontmatter_text = frontmatter_match.group(1)
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = yaml.load(frontmatter_text, Loader=loader)
 
             if not isinstance(frontmatter, dict):
-                self.errors.append("YAML frontmatter 必须是键值对格式")
+                self._add_error("YAML frontmatter 必须是键值对格式")
+                self._fatal = True
                 return
 
             self.frontmatter = frontmatter
-            self.passed_checks.append("✓ YAML frontmatter 格式有效")
+            self._add_passed("✓ YAML frontmatter 格式有效")
 
             # 检查必需字段
             if 'name' not in frontmatter:
-                self.errors.append("YAML frontmatter 缺少 'name' 字段")
+                self._add_error("YAML frontmatter 缺少 'name' 字段")
+            elif not isinstance(frontmatter['name'], str):
+                self._add_error("name 必须是字符串: %r", frontmatter['name'])
             else:
-                self.passed_checks.append(f"✓ name: {frontmatter['name']}")
+                self._add_passed("✓ name: %s", frontmatter['name'])
 
             if 'description' not in frontmatter:
-                self.errors.append("YAML frontmatter 缺少 'description' 字段")
+                self._add_error("YAML frontmatter 缺少 'description' 字段")
+            elif not isinstance(frontmatter['description'], str):
+                self._add_error("description 必须是字符串: %r", frontmatter['description'])
             else:
-                self.passed_checks.append(f"✓ description: {frontmatter['description'][:50]}...")
+                self._add_passed("✓ description: %s...", frontmatter['description'][:50])
 
         except yaml.YAMLError as e:
-            self.errors.append(f"YAML frontmatter 解析失败: {e}")
+            self._add_error("YAML frontmatter 解析失败: %s", e)
+            self._fatal = True
         except Exception as e:
-            self.errors.append(f"解析 frontmatter 时出错: {e}")
+            self._add_error("解析 frontmatter 时出错: %s", e)
+            self._fatal = True
 
     def _check_name_format(self):
         """检查 name 字段格式"""
-        if not hasattr(self, 'frontmatter') or 'name' not in self.frontmatter:
+        # 缺失或类型错误已在 frontmatter 检查中报告
+        if self.frontmatter is None or not isinstance(self.frontmatter.get('name'), str):
             return
 
         name = self.frontmatter['name']
 
         # 检查长度
         if len(name) > 64:
-            self.errors.append(f"name 长度超过 64 字符: {len(name)}")
+            self._add_error("name 长度超过 64 字符: %d", len(name))
         else:
-            self.passed_checks.append(f"✓ name 长度符合要求 ({len(name)}/64)")
+            self._add_passed("✓ name 长度符合要求 (%d/64)", len(name))
 
         # 检查格式：小写字母、数字、连字符
-        if not re.match(r'^[a-z0-9-]+$', name):
-            self.errors.append(f"name 格式无效: '{name}' (只能包含小写字母、数字和连字符)")
+        if not _NAME_RE.match(name):
+            self._add_error("name 格式无效: '%s' (只能包含小写字母、数字和连字符)", name)
         else:
-            self.passed_checks.append("✓ name 格式正确")
+            self._add_passed("✓ name 格式正确")
 
         # 检查是否以连字符开头或结尾
         if name.startswith('-') or name.endswith('-'):
-            self.warnings.append("name 不应以连字符开头或结尾")
+            self._add_warning("name 不应以连字符开头或结尾")
 
         # 检查是否有连续连字符
         if '--' in name:
-            self.warnings.append("name 不应包含连续连字符")
+            self._add_warning("name 不应包含连续连字符")
 
     def _check_description_length(self):
         """检查 description 字段长度"""
-        if not hasattr(self, 'frontmatter') or 'description' not in self.frontmatter:
+        if self.frontmatter is None or not isinstance(self.frontmatter.get('description'), str):
             return
 
         description = self.frontmatter['description']
 
         if len(description) > 1024:
-            self.errors.append(f"description 长度超过 1024 字符: {len(description)}")
+            self._add_error("description 长度超过 1024 字符: %d", len(description))
         else:
-            self.passed_checks.append(f"✓ description 长度符合要求 ({len(description)}/1024)")
+            self._add_passed("✓ description 长度符合要求 (%d/1024)", len(description))
 
         # 检查是否说明功能和时机
         if len(description) < 20:
-            self.warnings.append("description 过短，应详细说明功能和使用时机")
+            self._add_warning("description 过短，应详细说明功能和使用时机")
 
     def _check_references(self):
         """检查 references 目录和引用的文件"""
-        skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
-            skill_md = self.skill_path / "skill.md"
-        if not skill_md.exists():
+        if self._fatal:
             return
 
-        content = skill_md.read_text(encoding='utf-8')
-
         # 查找所有 references/ 链接
-        ref_links = re.findall(r'\[([^\]]+)\]\(references/([^\)]+)\)', content)
+        ref_links = [link.decode('utf-8', 'replace') for link in _REF_RE.findall(self._skill_md_data)]
 
         if ref_links:
-            refs_dir = self.skill_path / "references"
-            if not refs_dir.exists():
-                self.errors.append(f"SKILL.md 引用了 references/ 但目录不存在")
+            if not self._has_dir("references"):
+                self._add_error("SKILL.md 引用了 references/ 但目录不存在")
             else:
-                for link_text, file_path in ref_links:
-                    ref_file = refs_dir / file_path
-                    if not ref_file.exists():
-                        self.errors.append(f"引用的文件不存在: references/{file_path}")
+                for file_path in ref_links:
+                    target = os.path.join(self._refs_dir, file_path)
+                    self._ref_targets.append(target)
+                    if not os.path.exists(target):
+                        self._add_error("引用的文件不存在: references/%s", file_path)
                     else:
-                        self.passed_checks.append(f"✓ 引用文件存在: references/{file_path}")
+                        self._add_passed("✓ 引用文件存在: references/%s", file_path)
 
     def _check_scripts(self):
         """检查 scripts 目录中的脚本"""
-        scripts_dir = self.skill_path / "scripts"
-        if scripts_dir.exists():
-            scripts = list(scripts_dir.glob("*.py"))
-            for script in scripts:
-                self.passed_checks.append(f"✓ 脚本文件: {script.name}")
+        if self._has_dir("scripts"):
+            with os.scandir(self._scripts_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.py') and entry.is_file():
+                        self._add_passed("✓ 脚本文件: %s", entry.name)
 
     def _check_path_formats(self):
         """检查文件路径格式（应使用 Unix 风格）"""
-        skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
-            skill_md = self.skill_path / "skill.md"
-        if not skill_md.exists():
+        if self._fatal:
             return
 
-        content = skill_md.read_text(encoding='utf-8')
+        data = self._skill_md_data
+
+        # 检查 Windows 风格路径：先用 find 查找反斜杠，
+        # 仅在命中所在的行内运行正则（路径不会跨行）
+        idx = data.find(b'\\\\')
+        while idx >= 0:
+            line_start = data.rfind(b'\n', 0, idx) + 1
+            line_end = data.find(b'\n', idx)
+            if line_end < 0:
+                line_end = len(data)
+            line = data[line_start:line_end].decode('utf-8', 'replace')
+            match = _WIN_PATH_RE.search(line)
+            if match:
+                self._add_warning("发现 Windows 风格路径，建议使用 Unix 风格 (/): %s", match.group())
+                return
+            idx = data.find(b'\\\\', line_end)
+
+        self._add_passed("✓ 路径格式正确 (Unix 风格)")
 
-        # 检查 Windows 风格路径
-        windows_paths = re.findall(r'[\w-]+\\\\[\w-]+', content)
-        if windows_paths:
-            self.warnings.append(f"发现 Windows 风格路径，建议使用 Unix 风格 (/): {windows_paths[0]}")
+    def format_results(self) -> str:
+        """将验证结果格式化为报告文本"""
+        lines = [f"验证 skill: {self.skill_path}", "=" * 50, "\n验证结果:", "=" * 50]
+
+        if self._passed:
+            lines.append(f"\n通过 ({len(self._passed)}):")
+            for item in self._passed:
+                lines.append("  " + _format_message(item))
+
+        if self._warnings:
+            lines.append(f"\n警告 ({len(self._warnings)}):")
+            for item in self._warnings:
+                lines.append("  ⚠ " + _format_message(item))
+
+        if self._errors:
+            lines.append(f"\n错误 ({len(self._errors)}):")
+            for item in self._errors:
+                lines.append("  ✗ " + _format_message(item))
+
+        lines.append("\n" + "=" * 50)
+        if len(self._errors) == 0:
+            lines.append("✓ 验证通过！")
         else:
-            self.passed_checks.append("✓ 路径格式正确 (Unix 风格)")
+            lines.append(f"✗ 验证失败：{len(self._errors)} 个错误需要修复")
+
+        return "\n".join(lines) + "\n"
 
     def _print_results(self):
         """打印验证结果"""
-        print("\n验证结果:")
-        print("=" * 50)
-
-        if self.passed_checks:
-            print(f"\n通过 ({len(self.passed_checks)}):")
-            for check in self.passed_checks:
-                print(f"  {check}")
-
-        if self.warnings:
-            print(f"\n警告 ({len(self.warnings)}):")
-            for warning in self.warnings:
-                print(f"  ⚠ {warning}")
-
-        if self.errors:
-            print(f"\n错误 ({len(self.errors)}):")
-            for error in self.errors:
-                print(f"  ✗ {error}")
-
-        print("\n" + "=" * 50)
-        if len(self.errors) == 0:
-            print("✓ 验证通过！")
-            return 0
-        else:
-            print(f"✗ 验证失败：{len(self.errors)} 个错误需要修复")
-            return 1
+        # 合并为一次写入，减少 write 系统调用
+        sys.stdout.write(self.format_results())
+        return 0 if len(self._errors) == 0 else 1
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """返回路径的 (mtime_ns, size)，不存在时返回 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cache_key(skill_dir: str) -> Tuple:
+    """由顶层条目和 references/ 下所有目录的 stat 结果组成缓存键"""
+    key = [_stat_key(os.path.join(skill_dir, name)) for name in _CACHE_KEY_ENTRIES]
+    # 目录中有文件增删时目录自身的 mtime 会变化，据此覆盖嵌套引用的存在性
+    for dirpath, _, _ in os.walk(os.path.join(skill_dir, 'references')):
+        key.append((dirpath, _stat_key(dirpath)))
+    return tuple(key)
+
+
+class _Uncacheable(Exception):
+    """结果不能缓存时抛出，lru_cache 不会缓存异常"""
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_cached(cls, skill_dir: str, key: Tuple) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """validate_cached 的缓存实现，key 仅用于区分不同的文件状态"""
+    validator = cls(skill_dir)
+    validator.run_checks()
+    result = validator.errors, validator.warnings, validator.passed_checks
+
+    # 解析到 references/ 之外的引用目标不在缓存键覆盖范围内
+    refs_root = os.path.realpath(validator._refs_dir) + os.sep
+    if any(not os.path.realpath(target).startswith(refs_root) for target in validator._ref_targets):
+        raise _Uncacheable(result)
+    return result
+
+
+def _validate_one(skill_path: str) -> Tuple[bool, str]:
+    """验证单个 skill，返回 (是否通过, 报告文本)，供批量模式的工作进程/线程调用"""
+    validator = SkillValidator(skill_path)
+    try:
+        success = validator.run_checks()
+    except Exception as e:
+        # 单个 skill 出错不应中断整个批次，记录为错误后继续
+        validator._add_error("验证过程中出错: %s: %s", type(e).__name__, e)
+        success = False
+    return success, validator.format_results()
+
+
+def validate_many(skill_paths: List[str]) -> bool:
+    """并行验证多个 skill，按输入顺序打印报告，全部通过时返回 True"""
+    if len(skill_paths) >= _PROCESS_POOL_THRESHOLD:
+        executor = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(skill_paths)))
+    else:
+        # 数量较少时进程启动开销不划算，且主要耗时在文件读取上
+        executor = ThreadPoolExecutor(max_workers=len(skill_paths))
+
+    failed = 0
+    with executor:
+        for success, report in executor.map(_validate_one, skill_paths):
+            sys.stdout.write(report + "\n")
+            if not success:
+                failed += 1
+
+    print(f"批量验证完成: 共 {len(skill_paths)} 个 skill，{failed} 个未通过")
+    return failed == 0
 
 
 def main():
+    # 设置控制台编码为 UTF-8（Windows 兼容），仅在控制台不是 UTF-8 时才包装
+    if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
     if len(sys.argv) < 2:
-        print("用法: python validate-skill.py <skill-path>")
+        print("用法: python validate-skill.py <skill-path> [<skill-path> ...]")
         print("示例: python validate-skill.py ./my-skill")
+        print("      python validate-skill.py ./skills/*")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    validator = SkillValidator(skill_path)
-    success = validator.validate()
+    skill_paths = sys.argv[1:]
+    if len(skill_paths) == 1:
+        success = SkillValidator(skill_paths[0]).validate()
+    else:
+        success = validate_many(skill_paths)
     sys.exit(0 if success else 1)
 
 